@@ -4,8 +4,11 @@ This program manages employee schedules for a company operating 7 days a week.
 Author: Harshith Kalluri
 """
 
+import io
 import random
-from typing import Dict, List, Set
+import sys
+from array import array
+from typing import Dict, List, Set, Tuple
 
 # Days of the week
 DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
@@ -13,6 +16,14 @@ DAYS = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sun
 # Shift types
 SHIFTS = ["Morning", "Afternoon", "Evening"]
 
+# Index of each day and shift; the scheduler stores them as these integers
+DAY_IDX = {day: i for i, day in enumerate(DAYS)}
+SHIFT_IDX = {shift: i for i, shift in enumerate(SHIFTS)}
+
+# Sets of valid day and shift names for constant-time input validation
+_DAYS_SET = frozenset(DAYS)
+_SHIFTS_SET = frozenset(SHIFTS)
+
 # Minimum employees required per shift
 MIN_EMPLOYEES_PER_SHIFT = 2
 
@@ -23,160 +34,265 @@ MAX_DAYS_PER_WEEK = 5
 class EmployeeScheduler:
     """Class to manage employee scheduling"""
     
-    def __init__(self):
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        "verbose",
+        "_log_buf",
+        "preferences",
+        "_pref_list",
+        "_employee_ids",
+        "_employee_names",
+        "schedule",
+        "counts",
+        "days_worked",
+        "_avail_by_day",
+    )
+    
+    def __init__(self, verbose: bool = False) -> None:
         """Initialize the scheduler with empty data structures"""
-        # Store employee preferences: {employee_name: {day: shift}}
-        self.preferences = {}
+        # Report scheduling progress when enabled; lines are buffered and
+        # written once per pass instead of one print call per assignment
+        self.verbose = verbose
+        self._log_buf: List[str] = []
+        
+        # Store employee preferences: {employee_name: {day_index: shift_index}}
+        self.preferences: Dict[str, Dict[int, int]] = {}
+        
+        # Preferences in insertion order: [(employee_id, day_index, shift_index)]
+        self._pref_list: List[Tuple[int, int, int]] = []
+        
+        # Map employee names to contiguous ids and back
+        self._employee_ids: Dict[str, int] = {}
+        self._employee_names: List[str] = []
         
-        # Store final schedule: {day: {shift: [employees]}}
-        self.schedule = {}
+        # Store final schedule: schedule[day_index][shift_index] is a fixed-size
+        # array of employee ids whose first counts[day_index][shift_index]
+        # slots are filled; create_schedule sizes the arrays
+        self.schedule: List[List["array[int]"]] = [[array("i") for _ in SHIFTS] for _ in DAYS]
+        self.counts: List[List[int]] = [[0] * len(SHIFTS) for _ in DAYS]
         
-        # Track days worked by each employee: {employee_name: number_of_days}
-        self.days_worked = {}
+        # Track days worked by each employee: days_worked[employee_id]
+        self.days_worked: List[int] = []
         
-        # Initialize schedule structure
-        for day in DAYS:
-            self.schedule[day] = {
-                "Morning": [],
-                "Afternoon": [],
-                "Evening": []
-            }
+        # Employees still available on each day: [{employee_id}], filled in
+        # by create_schedule and shrunk by every assignment
+        self._avail_by_day: List[Set[int]] = [set() for _ in DAYS]
     
-    def add_employee_preference(self, name: str, day: str, shift: str):
+    def add_employee_preference(self, name: str, day: str, shift: str) -> bool:
         """Add an employee's shift preference for a specific day"""
         
         # Input validation
-        if day not in DAYS:
+        if day not in _DAYS_SET:
             print(f"Error: {day} is not a valid day")
             return False
         
-        if shift not in SHIFTS:
+        if shift not in _SHIFTS_SET:
             print(f"Error: {shift} is not a valid shift")
             return False
         
         # Initialize employee if not exists
         if name not in self.preferences:
             self.preferences[name] = {}
-            self.days_worked[name] = 0
+            self._employee_ids[name] = len(self._employee_names)
+            self._employee_names.append(name)
+            self.days_worked.append(0)
         
         # Check if employee already has preference for this day
-        if day in self.preferences[name]:
+        day_index = DAY_IDX[day]
+        if day_index in self.preferences[name]:
             print(f"Warning: {name} already has a preference for {day}")
             return False
         
+        # Check if employee already has the maximum number of preferred days
+        if len(self.preferences[name]) >= MAX_DAYS_PER_WEEK:
+            print(f"Warning: {name} already has {MAX_DAYS_PER_WEEK} preferred days")
+            return False
+        
         # Add preference
-        self.preferences[name] = self.preferences.get(name, {})
-        self.preferences[name][day] = shift
+        self.preferences[name][day_index] = SHIFT_IDX[shift]
+        self._pref_list.append((self._employee_ids[name], day_index, SHIFT_IDX[shift]))
         
         return True
     
-    def create_schedule(self):
+    def create_schedule(self) -> None:
         """Create the weekly schedule based on preferences and constraints"""
         
-        print("\n=== Starting Schedule Creation ===\n")
+        self._log("\n=== Starting Schedule Creation ===\n")
+        
+        # Check up front whether the staffing minimum can be met at all
+        self._check_capacity()
+        
+        # Each call builds the week from scratch
+        num_employees = len(self._employee_names)
+        self.days_worked = [0] * num_employees
+        
+        # An employee works at most one shift per day, so no shift can hold
+        # more than the number of employees
+        self.schedule = [[array("i", [-1] * num_employees) for _ in SHIFTS] for _ in DAYS]
+        self.counts = [[0] * len(SHIFTS) for _ in DAYS]
+        
+        # Every employee starts out available on every day
+        self._avail_by_day = [set(range(num_employees)) for _ in DAYS]
         
         # First pass: Assign employees to their preferred shifts
-        for employee, prefs in self.preferences.items():
-            for day, preferred_shift in prefs.items():
-                
-                # Check if employee hasn't exceeded maximum days
-                if self.days_worked[employee] >= MAX_DAYS_PER_WEEK:
-                    print(f"{employee} has already worked {MAX_DAYS_PER_WEEK} days")
-                    continue
-                
-                # Check if employee is not already scheduled for this day
-                already_scheduled = False
-                for shift in SHIFTS:
-                    if employee in self.schedule[day][shift]:
-                        already_scheduled = True
-                        break
-                
-                if already_scheduled:
-                    print(f"{employee} is already scheduled on {day}")
-                    continue
-                
-                # Assign to preferred shift
-                self.schedule[day][preferred_shift].append(employee)
-                self.days_worked[employee] += 1
-                print(f"Assigned {employee} to {preferred_shift} shift on {day}")
+        self._assign_preferred_shifts()
+        self._flush_log()
         
         # Second pass: Fill shifts that have fewer than minimum employees
-        print("\n=== Filling Understaffed Shifts ===\n")
+        self._log("\n=== Filling Understaffed Shifts ===\n")
+        self._fill_understaffed_shifts()
+        
+        self._log("\n=== Schedule Creation Complete ===\n")
+        self._flush_log()
+    
+    def _check_capacity(self) -> None:
+        """Warn when the employees cannot cover every shift at the minimum"""
+        
+        num_employees = len(self._employee_names)
+        
+        # Each employee covers at most one shift per day
+        per_day_needed = len(SHIFTS) * MIN_EMPLOYEES_PER_SHIFT
+        if num_employees < per_day_needed:
+            self._warn(f"Warning: {num_employees} employees cannot cover the "
+                       f"{per_day_needed} shift slots needed each day")
         
-        for day in DAYS:
-            for shift in SHIFTS:
-                current_count = len(self.schedule[day][shift])
+        # Each employee covers at most MAX_DAYS_PER_WEEK shifts per week
+        week_capacity = num_employees * MAX_DAYS_PER_WEEK
+        week_needed = len(DAYS) * per_day_needed
+        if week_capacity < week_needed:
+            self._warn(f"Warning: {num_employees} employees can cover at most "
+                       f"{week_capacity} of the {week_needed} shift slots needed this week")
+    
+    def _assign_preferred_shifts(self) -> None:
+        """Assign each employee to their preferred shift where constraints allow
+        
+        Every stored preference is on a distinct day for its employee, each
+        employee has at most MAX_DAYS_PER_WEEK of them, and create_schedule
+        starts this pass from an empty week. All preferences are therefore
+        honored without further checks; only the fill pass makes choices.
+        """
+        
+        # Local aliases avoid repeated attribute lookups in the loop
+        names = self._employee_names
+        assign = self._assign
+        log = self._log
+        
+        for eid, di, si in self._pref_list:
+            # Assign to preferred shift
+            assign(eid, di, si)
+            log(f"Assigned {names[eid]} to {SHIFTS[si]} shift on {DAYS[di]}")
+    
+    def _fill_understaffed_shifts(self) -> None:
+        """Randomly assign available employees to shifts below the minimum"""
+        
+        # Local aliases avoid repeated attribute lookups in the loops
+        names = self._employee_names
+        counts = self.counts
+        assign = self._assign
+        log = self._log
+        
+        for di in range(len(DAYS)):
+            day_counts = counts[di]
+            
+            for si in range(len(SHIFTS)):
+                current_count = day_counts[si]
+                
+                if current_count >= MIN_EMPLOYEES_PER_SHIFT:
+                    continue
+                
+                # Find available employees once and shuffle them, so popping
+                # from the end picks a random employee for each open slot
+                available = self._find_available_employees(di)
+                random.shuffle(available)
                 
                 # If shift needs more employees
                 while current_count < MIN_EMPLOYEES_PER_SHIFT:
-                    # Find available employees
-                    available = self._find_available_employees(day)
-                    
                     if not available:
-                        print(f"Warning: Cannot fill {shift} shift on {day}")
+                        self._warn(f"Warning: Cannot fill {SHIFTS[si]} shift on {DAYS[di]}")
                         break
                     
-                    # Randomly select an available employee
-                    selected = random.choice(available)
-                    self.schedule[day][shift].append(selected)
-                    self.days_worked[selected] += 1
+                    # Take the next randomly ordered available employee
+                    selected = available.pop()
+                    assign(selected, di, si)
                     current_count += 1
                     
-                    print(f"Randomly assigned {selected} to {shift} shift on {day}")
-        
-        print("\n=== Schedule Creation Complete ===\n")
+                    log(f"Randomly assigned {names[selected]} to {SHIFTS[si]} shift on {DAYS[di]}")
     
-    def _find_available_employees(self, day: str) -> List[str]:
-        """Find employees who are available to work on a specific day"""
-        available = []
-        
-        for employee in self.preferences.keys():
-            # Check if employee hasn't exceeded maximum days
-            if self.days_worked[employee] >= MAX_DAYS_PER_WEEK:
-                continue
-            
-            # Check if employee is not already scheduled for this day
-            already_scheduled = False
-            for shift in SHIFTS:
-                if employee in self.schedule[day][shift]:
-                    already_scheduled = True
-                    break
-            
-            if not already_scheduled:
-                available.append(employee)
+    def _assign(self, eid: int, di: int, si: int) -> None:
+        """Schedule an employee for a shift and update the tracking structures"""
+        day_counts = self.counts[di]
+        slot = day_counts[si]
+        assert slot < len(self.schedule[di][si]), "shift holds more employees than exist"
+        self.schedule[di][si][slot] = eid
+        day_counts[si] = slot + 1
+        days = self.days_worked[eid] + 1
+        self.days_worked[eid] = days
         
-        return available
+        # The employee is no longer available today, or on any day once
+        # they reach the weekly limit
+        if days >= MAX_DAYS_PER_WEEK:
+            for available in self._avail_by_day:
+                available.discard(eid)
+        else:
+            self._avail_by_day[di].discard(eid)
+    
+    def _find_available_employees(self, di: int) -> List[int]:
+        """Find ids of employees who are available to work on a specific day index"""
+        # Available means under the weekly limit and not yet scheduled today
+        return list(self._avail_by_day[di])
     
-    def print_schedule(self):
+    def _log(self, message: str) -> None:
+        """Buffer a progress message when verbose output is enabled"""
+        if self.verbose:
+            self._log_buf.append(message)
+    
+    def _flush_log(self) -> None:
+        """Write all buffered progress messages in a single call"""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            self._log_buf.clear()
+    
+    def _warn(self, message: str) -> None:
+        """Print a warning immediately, after any buffered progress messages"""
+        self._flush_log()
+        print(message)
+    
+    def print_schedule(self) -> None:
         """Print the final schedule in a readable format"""
         
-        print("\n" + "="*70)
-        print("FINAL EMPLOYEE SCHEDULE FOR THE WEEK")
-        print("="*70 + "\n")
+        # Build the whole report first and write it to stdout in one call
+        buf = io.StringIO()
         
-        for day in DAYS:
-            print(f"\n{day.upper()}")
-            print("-" * 50)
+        buf.write("\n" + "="*70 + "\n")
+        buf.write("FINAL EMPLOYEE SCHEDULE FOR THE WEEK\n")
+        buf.write("="*70 + "\n\n")
+        
+        for di, day in enumerate(DAYS):
+            buf.write(f"\n{day.upper()}\n")
+            buf.write("-" * 50 + "\n")
             
-            for shift in SHIFTS:
-                employees = self.schedule[day][shift]
+            for si, shift in enumerate(SHIFTS):
+                shift_ids = self.schedule[di][si][:self.counts[di][si]]
+                employees = [self._employee_names[eid] for eid in shift_ids]
                 employee_list = ", ".join(employees) if employees else "No employees assigned"
-                print(f"  {shift:15} : {employee_list}")
+                buf.write(f"  {shift:15} : {employee_list}\n")
         
-        print("\n" + "="*70)
-        print("EMPLOYEE WORK SUMMARY")
-        print("="*70 + "\n")
+        buf.write("\n" + "="*70 + "\n")
+        buf.write("EMPLOYEE WORK SUMMARY\n")
+        buf.write("="*70 + "\n\n")
         
         # Sort employees by name
-        sorted_employees = sorted(self.days_worked.items())
+        sorted_employees = sorted(zip(self._employee_names, self.days_worked))
         
         for employee, days in sorted_employees:
-            print(f"  {employee:20} : {days} days")
+            buf.write(f"  {employee:20} : {days} days\n")
+        
+        buf.write("\n" + "="*70 + "\n\n")
         
-        print("\n" + "="*70 + "\n")
+        sys.stdout.write(buf.getvalue())
 
 
-def main():
+def main() -> None:
     """Main function to run the employee scheduling application"""
     
     print("="*70)
@@ -184,7 +300,7 @@ def main():
     print("="*70)
     
     # Create scheduler instance
-    scheduler = EmployeeScheduler()
+    scheduler = EmployeeScheduler(verbose=True)
     
     # Sample data: Add employee preferences
     print("\n=== Adding Employee Preferences ===\n")
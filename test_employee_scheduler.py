@@ -0,0 +1,85 @@
+"""
+Smoke tests for the Python employee scheduler.
+Run with: python3 -m unittest test_employee_scheduler
+"""
+
+import contextlib
+import io
+import random
+import unittest
+
+from employee_scheduler import DAYS, SHIFTS, MAX_DAYS_PER_WEEK, EmployeeScheduler
+
+# Same preferences as the sample data in main()
+SAMPLE_PREFERENCES = [
+    ("Alice", "Monday", "Morning"), ("Alice", "Tuesday", "Morning"),
+    ("Alice", "Wednesday", "Morning"), ("Alice", "Thursday", "Morning"),
+    ("Alice", "Friday", "Morning"),
+    ("Bob", "Monday", "Afternoon"), ("Bob", "Wednesday", "Afternoon"),
+    ("Bob", "Friday", "Afternoon"), ("Bob", "Saturday", "Afternoon"),
+    ("Charlie", "Tuesday", "Evening"), ("Charlie", "Thursday", "Evening"),
+    ("Charlie", "Saturday", "Evening"),
+    ("Diana", "Monday", "Morning"), ("Diana", "Tuesday", "Afternoon"),
+    ("Diana", "Wednesday", "Evening"), ("Diana", "Friday", "Morning"),
+    ("Eva", "Monday", "Evening"), ("Eva", "Wednesday", "Morning"),
+    ("Eva", "Thursday", "Afternoon"), ("Eva", "Sunday", "Evening"),
+    ("Frank", "Tuesday", "Morning"), ("Frank", "Thursday", "Morning"),
+    ("Frank", "Saturday", "Morning"),
+    ("Grace", "Monday", "Afternoon"), ("Grace", "Wednesday", "Afternoon"),
+    ("Grace", "Friday", "Evening"), ("Grace", "Sunday", "Morning"),
+    ("Henry", "Tuesday", "Evening"), ("Henry", "Thursday", "Evening"),
+    ("Henry", "Saturday", "Afternoon"),
+]
+
+
+def assigned_names(scheduler, di, si):
+    """Return the names of the employees assigned to a shift"""
+    ids = scheduler.schedule[di][si][:scheduler.counts[di][si]]
+    return [scheduler._employee_names[eid] for eid in ids]
+
+
+class EmployeeSchedulerTest(unittest.TestCase):
+    """Check the scheduling constraints on the sample data"""
+
+    def check_schedule(self, scheduler):
+        """Assert that the current schedule satisfies every constraint"""
+
+        # No shift holds more employees than its array has slots
+        for di in range(len(DAYS)):
+            for si in range(len(SHIFTS)):
+                self.assertLessEqual(scheduler.counts[di][si], len(scheduler.schedule[di][si]))
+
+        # No employee works more than one shift per day
+        days_counted = {}
+        for di, day in enumerate(DAYS):
+            names = [name for si in range(len(SHIFTS)) for name in assigned_names(scheduler, di, si)]
+            self.assertEqual(len(names), len(set(names)), f"duplicate employee on {day}")
+            for name in names:
+                days_counted[name] = days_counted.get(name, 0) + 1
+
+        # days_worked matches the schedule and respects the weekly limit
+        for name, days in zip(scheduler._employee_names, scheduler.days_worked):
+            self.assertEqual(days, days_counted.get(name, 0))
+            self.assertLessEqual(days, MAX_DAYS_PER_WEEK)
+
+        # Every preference is honored
+        for name, day, shift in SAMPLE_PREFERENCES:
+            self.assertIn(name, assigned_names(scheduler, DAYS.index(day), SHIFTS.index(shift)))
+
+    def test_repeated_create_schedule(self):
+        """Every call to create_schedule rebuilds a valid week"""
+        for seed in range(50):
+            random.seed(seed)
+            scheduler = EmployeeScheduler()
+            for name, day, shift in SAMPLE_PREFERENCES:
+                self.assertTrue(scheduler.add_employee_preference(name, day, shift))
+
+            for _ in range(2):
+                # Unfillable shifts are expected with this data; hide the warnings
+                with contextlib.redirect_stdout(io.StringIO()):
+                    scheduler.create_schedule()
+                self.check_schedule(scheduler)
+
+
+if __name__ == "__main__":
+    unittest.main()